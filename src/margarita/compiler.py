@@ -0,0 +1,273 @@
+"""Compiler for Margarita templates.
+
+This module turns parsed AST nodes into a Python function, so a template that
+is rendered many times pays for walking its AST only once. The generated
+function produces exactly the same output as ``Renderer.render``.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from margarita.parser import (
+    ForNode,
+    IfNode,
+    IncludeNode,
+    Node,
+    TextNode,
+    VariableNode,
+)
+from margarita.renderer import Renderer, compile_text, resolve_path, variable_path
+
+CompiledTemplate = Callable[..., str]
+
+
+def _render_include(node: IncludeNode, context: dict[str, Any], base_path: Path | None) -> str:
+    """Render an include exactly as the interpreting renderer would."""
+    return Renderer(context=context, base_path=base_path).render([node])
+
+
+def _lookup_from(value: Any, path: tuple[str, ...]) -> Any:
+    """Resolve the rest of a dotted path starting from an already-known value."""
+    return None if value is None else resolve_path(value, path)
+
+
+class _CodeGenerator:
+    """Emit the source of a ``_render(context=None, base_path=None)`` function."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {}
+        self._counter = 0
+
+    def generate(self, nodes: list[Node]) -> str:
+        self._emit(0, "def _render(context=None, base_path=None):")
+        # Work on a copy so loop variables never leak into the caller's dict
+        self._emit(1, "_ctx = dict(context) if context else {}")
+        self._emit_body(nodes)
+        return "\n".join(self.lines) + "\n"
+
+    def _emit_body(self, nodes: list[Node]) -> None:
+        self._emit(1, "_out = []")
+        self._emit(1, "_w = _out.append")
+        self._emit_block(nodes, 1)
+        self._emit(1, 'return "".join(_out)')
+
+    def _emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def _new_name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def _lookup_expr(self, path: tuple[str, ...]) -> str:
+        """Return an expression evaluating to the variable's value."""
+        return f"_lookup(_ctx, {path!r})"
+
+    def _emit_block(self, nodes: list[Node], depth: int) -> None:
+        start = len(self.lines)
+        for node in nodes:
+            self._emit_node(node, depth)
+        if len(self.lines) == start:
+            self._emit(depth, "pass")
+
+    def _emit_value(self, path: tuple[str, ...], depth: int) -> None:
+        value = self._new_name("v")
+        self._emit(depth, f"{value} = {self._lookup_expr(path)}")
+        self._emit(depth, f"if {value} is not None:")
+        self._emit(depth + 1, f"_w(str({value}))")
+
+    def _emit_node(self, node: Node, depth: int) -> None:
+        if isinstance(node, TextNode):
+            for segment in compile_text(node.content):
+                if isinstance(segment, str):
+                    self._emit(depth, f"_w({segment!r})")
+                else:
+                    self._emit_value(segment, depth)
+
+        elif isinstance(node, VariableNode):
+            self._emit_value(variable_path(node.name), depth)
+
+        elif isinstance(node, IfNode):
+            condition = self._lookup_expr(variable_path(node.condition))
+            self._emit(depth, f"if _truthy({condition}):")
+            self._emit_block(node.true_block, depth + 1)
+            if node.false_block:
+                self._emit(depth, "else:")
+                self._emit_block(node.false_block, depth + 1)
+
+        elif isinstance(node, ForNode):
+            iterable = self._new_name("iterable")
+            self._emit(depth, f"{iterable} = {self._lookup_expr(variable_path(node.iterable))}")
+            self._emit(depth, f"if {iterable}:")
+            self._emit_for(node, iterable, depth + 1)
+
+        elif isinstance(node, IncludeNode):
+            constant = self._new_name("include")
+            self.constants[constant] = node
+            self._emit(depth, f"_w(_include({constant}, {self._context_expr()}, base_path))")
+
+    def _emit_for(self, node: ForNode, iterable: str, depth: int) -> None:
+        item = self._new_name("item")
+        old_value = self._new_name("old")
+        self._emit(depth, f"for {item} in {iterable}:")
+        self._emit(depth + 1, f"{old_value} = _ctx.get({node.iterator!r})")
+        self._emit(depth + 1, f"_ctx[{node.iterator!r}] = {item}")
+        self._emit_block(node.block, depth + 1)
+        self._emit(depth + 1, f"if {old_value} is not None:")
+        self._emit(depth + 2, f"_ctx[{node.iterator!r}] = {old_value}")
+        self._emit(depth + 1, "else:")
+        self._emit(depth + 2, f"_ctx.pop({node.iterator!r}, None)")
+
+    def _context_expr(self) -> str:
+        """Return an expression for the full context dict at this point."""
+        return "_ctx"
+
+
+class _SpecializedCodeGenerator(_CodeGenerator):
+    """Emit a render function specialized to the names a template reads.
+
+    The generated ``_render(context=None, base_path=None)`` reads each of
+    ``names`` from the context once, into locals, and binds loop variables to
+    locals, so no context copy, lookups or mutation happen while rendering.
+    A missing name reads as None, which renders exactly like an absent key.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        super().__init__()
+        self.names = names
+        self.scope: dict[str, str] = {name: f"_k{index}" for index, name in enumerate(names)}
+        # Loop variables currently bound, innermost last
+        self.loop_bindings: list[tuple[str, str]] = []
+
+    def generate(self, nodes: list[Node]) -> str:
+        self._emit(0, "def _render(context=None, base_path=None):")
+        self._emit(1, "context = context or {}")
+        for name in self.names:
+            self._emit(1, f"{self.scope[name]} = context.get({name!r})")
+        self._emit_body(nodes)
+        return "\n".join(self.lines) + "\n"
+
+    def _lookup_expr(self, path: tuple[str, ...]) -> str:
+        # Every free name is in scope, see _free_names
+        head = self.scope[path[0]]
+        rest = path[1:]
+        return f"_lookup_from({head}, {rest!r})" if rest else head
+
+    def _emit_for(self, node: ForNode, iterable: str, depth: int) -> None:
+        item = self._new_name("item")
+        self._emit(depth, f"for {item} in {iterable}:")
+
+        # The loop variable shadows any outer binding for the body only; the
+        # renderer restores (or removes) the outer value after the loop.
+        outer = self.scope.get(node.iterator)
+        self.scope[node.iterator] = item
+        self.loop_bindings.append((node.iterator, item))
+        self._emit_block(node.block, depth + 1)
+        self.loop_bindings.pop()
+        if outer is None:
+            del self.scope[node.iterator]
+        else:
+            self.scope[node.iterator] = outer
+
+    def _context_expr(self) -> str:
+        if not self.loop_bindings:
+            return "context"
+        bindings = ", ".join(f"{name!r}: {item}" for name, item in self.loop_bindings)
+        return f"{{**context, {bindings}}}"
+
+
+def _build(generator: _CodeGenerator, nodes: list[Node]) -> CompiledTemplate:
+    source = generator.generate(nodes)
+
+    namespace: dict[str, Any] = {
+        "_lookup": resolve_path,
+        "_lookup_from": _lookup_from,
+        "_truthy": Renderer._is_truthy,
+        "_include": _render_include,
+        **generator.constants,
+    }
+    exec(compile(source, "<margarita>", "exec"), namespace)
+
+    render: CompiledTemplate = namespace["_render"]
+    return render
+
+
+def compile_template(nodes: list[Node]) -> CompiledTemplate:
+    """Compile parsed AST nodes into a render function.
+
+    Args:
+        nodes: List of parsed AST nodes, as returned by ``Parser.parse``
+
+    Returns:
+        A function ``render(context=None, base_path=None) -> str`` producing the
+        same output as ``Renderer(context, base_path).render(nodes)``. The
+        caller's context dict is never modified.
+    """
+    try:
+        return _build(_CodeGenerator(), nodes)
+    except SyntaxError:
+        # Deeply nested templates can exceed Python's own limits (statically
+        # nested blocks, indentation depth); interpret those instead.
+        return _interpret(nodes)
+
+
+def _interpret(nodes: list[Node]) -> CompiledTemplate:
+    """Wrap the interpreting renderer in the compiled-template calling convention."""
+
+    def render(context: dict[str, Any] | None = None, base_path: Path | None = None) -> str:
+        return Renderer(context=dict(context) if context else {}, base_path=base_path).render(nodes)
+
+    return render
+
+
+def _free_names(nodes: list[Node], bound: frozenset[str] = frozenset()) -> dict[str, None]:
+    """Collect the context names a template reads, in first-use order.
+
+    Names bound by an enclosing loop are skipped; includes receive the whole
+    context, so they add none.
+    """
+    names: dict[str, None] = {}
+
+    def use(path: tuple[str, ...]) -> None:
+        if path[0] not in bound:
+            names[path[0]] = None
+
+    for node in nodes:
+        if isinstance(node, TextNode):
+            for segment in compile_text(node.content):
+                if not isinstance(segment, str):
+                    use(segment)
+        elif isinstance(node, VariableNode):
+            use(variable_path(node.name))
+        elif isinstance(node, IfNode):
+            use(variable_path(node.condition))
+            names.update(_free_names(node.true_block, bound))
+            names.update(_free_names(node.false_block or [], bound))
+        elif isinstance(node, ForNode):
+            use(variable_path(node.iterable))
+            names.update(_free_names(node.block, bound | {node.iterator}))
+    return names
+
+
+def specialize_template(nodes: list[Node]) -> CompiledTemplate:
+    """Compile parsed AST nodes into a render function specialized to the template.
+
+    Unlike ``compile_template``, the function reads every name the template
+    uses from the context once, into locals, and keeps loop variables in
+    locals too, so rendering never copies, walks or mutates the context. One
+    function serves every context, whatever its keys or their order.
+
+    Args:
+        nodes: List of parsed AST nodes, as returned by ``Parser.parse``
+
+    Returns:
+        A function ``render(context=None, base_path=None) -> str`` producing the
+        same output as ``Renderer(context, base_path).render(nodes)``. The
+        caller's context dict is never modified.
+    """
+    try:
+        return _build(_SpecializedCodeGenerator(tuple(_free_names(nodes))), nodes)
+    except SyntaxError:
+        # Too deeply nested to compile; compile_template interprets those
+        return compile_template(nodes)
@@ -1,7 +1,7 @@
 from pathlib import Path
 
+from margarita.compiler import CompiledTemplate, specialize_template
 from margarita.parser import Parser
-from margarita.renderer import Renderer
 
 
 class Composer:
@@ -9,6 +9,7 @@ class Composer:
         self.template_dir = template_dir
         self.parser = Parser()
         self._template_cache: dict[str, tuple] = {}
+        self._compiled_cache: dict[str, CompiledTemplate] = {}
 
     def load_template(self, template_path: str) -> tuple:
         """Load and parse a template, using cache if available.
@@ -39,11 +40,13 @@ class Composer:
         Returns:
             str: Rendered template string.
         """
-        _, nodes = self.load_template(template_path)
+        cache_key = str(template_path)
 
-        renderer = Renderer(context=context, base_path=self.template_dir)
+        if cache_key not in self._compiled_cache:
+            _, nodes = self.load_template(template_path)
+            self._compiled_cache[cache_key] = specialize_template(nodes)
 
-        return renderer.render(nodes)
+        return self._compiled_cache[cache_key](context, self.template_dir)
 
     def compose_prompt(self, snippets: list[str], context: dict, separator: str = "\n\n") -> str:
         """Compose a prompt from multiple snippet files.
@@ -1,58 +1,101 @@
+import functools
 import re
+import weakref
 from dataclasses import dataclass, field
 
 
 # -------------------------
 # AST Nodes
 # -------------------------
-@dataclass
+# Nodes are frozen, slotted dataclasses: parsed templates are shared between
+# callers (see parse_cached and _text_node), so they must not be mutated.
 class Node:
     """Base class for AST nodes."""
 
-    pass
+    # Keep instances weak-referenceable for the TextNode intern table.
+    __slots__ = ("__weakref__",)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextNode(Node):
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VariableNode(Node):
     name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IfNode(Node):
     condition: str
     true_block: list[Node]
     false_block: list[Node] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForNode(Node):
     iterator: str
     iterable: str
     block: list[Node]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncludeNode(Node):
     template_name: str
     params: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetadataNode(Node):
     key: str
     value: str
 
 
+# -------------------------
+# Patterns
+# -------------------------
+# Matches one "key: value" line of a metadata block. Whitespace never spans
+# lines ([^\S\n]), so a key with an empty value cannot capture the next line.
+_METADATA_RE = re.compile(r"^[^\S\n]*(\w+):[^\S\n]*(\S.*)$", re.MULTILINE)
+
+# A single pattern recognizes every control-structure line; the name of the
+# outermost group that matched (``lastgroup``) identifies the statement kind.
+_STATEMENT_RE = re.compile(
+    r"^(?:"
+    r"(?P<if>if\s+(?P<condition>\w+):)"
+    r"|(?P<for>for\s+(?P<iterator>\w+)\s+in\s+(?P<iterable>\w+):)"
+    r"|(?P<else>else:)"
+    r"|(?P<include>\[\[\s*(?P<include_content>[^]]+)\s*]])"
+    r")$"
+)
+
+_INCLUDE_PARAM_RE = re.compile(r"(\w+)=(?:\"([^\"]*)\"|([^\"\s]+))")
+
+
+# -------------------------
+# Node interning
+# -------------------------
+# Identical text produces a single shared TextNode (flyweight). Entries vanish
+# once no parsed template references them. Nodes are never mutated after
+# parsing, which is what makes sharing them safe.
+_TEXT_NODES: "weakref.WeakValueDictionary[str, TextNode]" = weakref.WeakValueDictionary()
+
+
+def _text_node(content: str) -> TextNode:
+    """Return the shared TextNode for ``content``, creating it on first use."""
+    node = _TEXT_NODES.get(content)
+    if node is None:
+        node = TextNode(content)
+        _TEXT_NODES[content] = node
+    return node
+
+
 # -------------------------
 # Parser
 # -------------------------
 class Parser:
-    def __init__(self):
+    def __init__(self) -> None:
         self.metadata: dict[str, str] = {}
         self.lines: list[tuple[int, str]] = []  # (indent_level, line_content)
         self.pos: int = 0
@@ -90,24 +133,18 @@ class Parser:
 
         # Check if we have metadata block
         if i < len(lines) and lines[i].strip() == "---":
-            # Found metadata block
-            i += 1  # Skip opening ---
-
-            # Parse metadata lines until we find closing ---
-            while i < len(lines):
-                line = lines[i]
-                stripped = line.strip()
-
-                # Check for closing delimiter
-                if stripped == "---":
-                    i += 1  # Skip closing ---
-                    break
-
-                # Parse metadata line
-                metadata_match = re.match(r"^(\w+):\s*(.+)$", stripped)
-                if metadata_match:
-                    self.metadata[metadata_match.group(1)] = metadata_match.group(2).strip()
-                i += 1
+            # Found metadata block; it runs until the closing --- or the end
+            start = i + 1
+            end = next(
+                (j for j in range(start, len(lines)) if lines[j].strip() == "---"), len(lines)
+            )
+
+            # Extract every key: value pair from the block in a single scan
+            block = "\n".join(lines[start:end])
+            for metadata_match in _METADATA_RE.finditer(block):
+                self.metadata[metadata_match.group(1)] = metadata_match.group(2).strip()
+
+            i = end + 1  # Skip closing ---
         else:
             # No metadata block, reset to start
             i = 0
@@ -126,7 +163,8 @@ class Parser:
 
     def _parse_block(self, base_indent: int) -> list[Node]:
         """Parse a block of nodes at a given indentation level."""
-        nodes: list[Node] = []
+        # Text blocks are collected as raw strings and turned into nodes on return
+        nodes: list[Node | str] = []
 
         while self.pos < len(self.lines):
             indent, line = self.lines[self.pos]
@@ -142,15 +180,13 @@ class Parser:
                 continue
 
             # Check for control structures
-            if_match = re.match(r"^if\s+(\w+):$", stripped)
-            for_match = re.match(r"^for\s+(\w+)\s+in\s+(\w+):$", stripped)
-            else_match = re.match(r"^else:$", stripped)
-            include_match = re.match(r"^\[\[\s*([^]]+)\s*]]$", stripped)
-            text_block_start = stripped.startswith("<<")
+            statement = _STATEMENT_RE.match(stripped)
+            kind = statement.lastgroup if statement else None
+            groups = statement.groupdict() if statement else {}
 
-            if if_match:
+            if kind == "if":
                 # Parse if statement
-                condition = if_match.group(1)
+                condition = groups["condition"]
                 self.pos += 1
                 # Parse the true block - content should be more indented than the if statement
                 true_block = self._parse_block(indent)
@@ -166,22 +202,22 @@ class Parser:
 
                 nodes.append(IfNode(condition, true_block, false_block))
 
-            elif for_match:
+            elif kind == "for":
                 # Parse for loop
-                iterator = for_match.group(1)
-                iterable = for_match.group(2)
+                iterator = groups["iterator"]
+                iterable = groups["iterable"]
                 self.pos += 1
                 # Parse the loop block - content should be more indented than the for statement
                 block = self._parse_block(indent)
                 nodes.append(ForNode(iterator, iterable, block))
 
-            elif else_match:
+            elif kind == "else":
                 # We've hit an else at this level, return to let parent handle it
                 break
 
-            elif include_match:
+            elif kind == "include":
                 # Parse include with optional parameters
-                include_content = include_match.group(1).strip()
+                include_content = groups["include_content"].strip()
                 # Parse [[filename param1="value1" param2="value2"]]
                 parts = include_content.split(None, 1)
                 template_name = parts[0]
@@ -190,7 +226,7 @@ class Parser:
                 if len(parts) > 1:
                     # Parse parameters
                     param_str = parts[1]
-                    param_matches = re.finditer(r"(\w+)=(?:\"([^\"]*)\"|([^\"\s]+))", param_str)
+                    param_matches = _INCLUDE_PARAM_RE.finditer(param_str)
                     params = {}
                     for m in param_matches:
                         key = m.group(1)
@@ -200,17 +236,41 @@ class Parser:
                 nodes.append(IncludeNode(template_name, params))
                 self.pos += 1
 
-            elif text_block_start:
+            elif stripped.startswith("<<"):
                 # Parse text block
                 text_content = self._parse_text_block()
                 if text_content:
-                    nodes.append(TextNode(text_content))
+                    nodes.append(text_content)
 
             else:
                 # Unknown line - skip
                 self.pos += 1
 
-        return nodes
+        return self._merge_text_nodes(nodes)
+
+    @staticmethod
+    def _merge_text_nodes(nodes: list[Node | str]) -> list[Node]:
+        """Turn runs of adjacent text strings into single interned TextNodes.
+
+        Text blocks always end with a newline, so merging never joins the two
+        halves of a ``${var}`` placeholder.
+        """
+        merged: list[Node] = []
+        pending: list[str] = []
+
+        for node in nodes:
+            if isinstance(node, str):
+                pending.append(node)
+                continue
+            if pending:
+                merged.append(_text_node("".join(pending)))
+                pending = []
+            merged.append(node)
+
+        if pending:
+            merged.append(_text_node("".join(pending)))
+
+        return merged
 
     def _parse_text_block(self) -> str:
         """Parse a text block delimited by << and >>."""
@@ -288,3 +348,26 @@ class Parser:
         # Let's use a placeholder approach: we'll keep ${var} as is in TextNode
         # and the renderer will handle the substitution
         return text
+
+
+# -------------------------
+# Cached parsing
+# -------------------------
+@functools.lru_cache(maxsize=256)
+def _parse_cached(template: str) -> tuple[dict[str, str], list[Node]]:
+    return Parser().parse(template)
+
+
+def parse_cached(template: str) -> tuple[dict[str, str], list[Node]]:
+    """Parse a Margarita template, reusing the result for identical sources.
+
+    Args:
+        template (str): The template source string to parse.
+
+    Returns:
+        tuple[dict[str, str], list[Node]]: The same result as ``Parser.parse``.
+            The metadata dict is a fresh copy on every call, but the node list is
+            shared between callers and must be treated as read-only.
+    """
+    metadata, nodes = _parse_cached(template)
+    return dict(metadata), nodes
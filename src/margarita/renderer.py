@@ -4,7 +4,9 @@ This module provides functionality to render parsed AST nodes into strings
 by applying variable substitution and control flow logic.
 """
 
+import functools
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -13,11 +15,63 @@ from margarita.parser import (
     IfNode,
     IncludeNode,
     Node,
-    Parser,
     TextNode,
     VariableNode,
+    parse_cached,
 )
 
+_VARIABLE_RE = re.compile(r"\$\{([\w\.]+)\}")
+
+# A text segment is either literal output or the pre-split path of a ${var}.
+TextSegment = str | tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def variable_path(name: str) -> tuple[str, ...]:
+    """Split a dotted variable name like "user.name" into its lookup path."""
+    return tuple(name.split("."))
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_text(content: str) -> tuple[TextSegment, ...]:
+    """Pre-split text content into literal strings and ${var} lookup paths.
+
+    Text nodes are immutable and shared, so each distinct content is scanned
+    for placeholders once instead of on every render.
+    """
+    segments: list[TextSegment] = []
+    # re.split alternates literal text (even indices) and variable names (odd)
+    for index, piece in enumerate(_VARIABLE_RE.split(content)):
+        if index % 2:
+            segments.append(variable_path(piece))
+        elif piece:
+            segments.append(piece)
+    return tuple(segments)
+
+
+def resolve_path(context: Any, path: tuple[str, ...]) -> Any:
+    """Resolve a pre-split variable path against a context.
+
+    Each part is looked up as a dict key or, failing that, as an attribute.
+
+    Returns:
+        The variable value or None if any part is missing
+    """
+    value = context
+
+    for part in path:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif hasattr(value, part):
+            value = getattr(value, part)
+        else:
+            return None
+
+        if value is None:
+            return None
+
+    return value
+
 
 class Renderer:
     def __init__(self, context: dict[str, Any] | None = None, base_path: Path | None = None):
@@ -39,66 +93,127 @@ class Renderer:
         Returns:
             Rendered string output
         """
-        output = []
-        for node in nodes:
-            output.append(self._render_node(node))
+        output: list[str] = []
+        self._render_nodes(nodes, output)
         return "".join(output)
 
-    def _render_node(self, node: Node) -> str:
-        """Render a single AST node.
+    def render_iter(self, nodes: list[Node]) -> Iterator[str]:
+        """Render a list of AST nodes lazily.
+
+        Output is flushed before each loop and after every loop iteration, so
+        a template dominated by one large loop never holds its whole output.
+        Useful for streaming, e.g. ``f.writelines(renderer.render_iter(nodes))``.
 
         Args:
-            node: The AST node to render
+            nodes: List of parsed AST nodes to render
 
-        Returns:
-            Rendered string for this node
+        Yields:
+            Non-empty chunks of the rendered output, in order
         """
-        if isinstance(node, TextNode):
-            # Process ${variable} syntax in text
-            content = node.content
+        output: list[str] = []
+        yield from self._stream_nodes(nodes, output)
+        yield from self._flush(output)
 
-            # Replace ${var} with actual values
-            def replace_var(match):
-                var_name = match.group(1)
-                value = self._get_variable_value(var_name)
-                return str(value) if value is not None else ""
+    def _stream_nodes(self, nodes: list[Node], output: list[str]) -> Iterator[str]:
+        """Render AST nodes like ``_render_nodes``, yielding the buffer at loop boundaries.
 
-            content = re.sub(r"\$\{([\w\.]+)\}", replace_var, content)
-            return content
+        Args:
+            nodes: List of parsed AST nodes to render
+            output: Buffer holding the output not yet yielded
+        """
+        for node in nodes:
+            if isinstance(node, IfNode):
+                if self._is_truthy(self._get_variable_value(node.condition)):
+                    yield from self._stream_nodes(node.true_block, output)
+                elif node.false_block:
+                    yield from self._stream_nodes(node.false_block, output)
+
+            elif isinstance(node, ForNode):
+                iterable = self._get_variable_value(node.iterable)
+                if not iterable:
+                    continue
+
+                yield from self._flush(output)
+                old_value = self.context.get(node.iterator)
+                try:
+                    for item in iterable:
+                        self.context[node.iterator] = item
+                        yield from self._stream_nodes(node.block, output)
+                        yield from self._flush(output)
+                finally:
+                    # Also runs when the consumer stops iterating mid-loop
+                    if old_value is not None:
+                        self.context[node.iterator] = old_value
+                    else:
+                        self.context.pop(node.iterator, None)
+
+            else:
+                self._render_node(node, output)
+
+    @staticmethod
+    def _flush(output: list[str]) -> Iterator[str]:
+        """Yield the buffered output as one chunk, if there is any, and empty the buffer."""
+        if output:
+            yield "".join(output)
+            output.clear()
+
+    def _render_nodes(self, nodes: list[Node], output: list[str]) -> None:
+        """Render a list of AST nodes, appending the chunks to an output buffer.
+
+        Args:
+            nodes: List of parsed AST nodes to render
+            output: Buffer shared by the whole render, joined once at the end
+        """
+        for node in nodes:
+            self._render_node(node, output)
+
+    def _render_node(self, node: Node, output: list[str]) -> None:
+        """Render a single AST node.
+
+        Args:
+            node: The AST node to render
+            output: Buffer the rendered chunks are appended to
+        """
+        if isinstance(node, TextNode):
+            # Replace ${var} placeholders with their values
+            for segment in compile_text(node.content):
+                if isinstance(segment, str):
+                    output.append(segment)
+                    continue
+                value = self._resolve_path(segment)
+                if value is not None:
+                    output.append(str(value))
 
         elif isinstance(node, VariableNode):
             # Support dotted notation like "user.name"
             value = self._get_variable_value(node.name)
-            return str(value) if value is not None else ""
+            if value is not None:
+                output.append(str(value))
 
         elif isinstance(node, IfNode):
             condition_value = self._get_variable_value(node.condition)
             # Evaluate truthiness
             if self._is_truthy(condition_value):
-                return self.render(node.true_block)
+                self._render_nodes(node.true_block, output)
             elif node.false_block:
-                return self.render(node.false_block)
-            return ""
+                self._render_nodes(node.false_block, output)
 
         elif isinstance(node, ForNode):
             iterable = self._get_variable_value(node.iterable)
             if not iterable:
-                return ""
+                return
 
-            output = []
             for item in iterable:
                 old_value = self.context.get(node.iterator)
 
                 self.context[node.iterator] = item
-                output.append(self.render(node.block))
+                self._render_nodes(node.block, output)
 
                 if old_value is not None:
                     self.context[node.iterator] = old_value
                 else:
                     self.context.pop(node.iterator, None)
 
-            return "".join(output)
-
         elif isinstance(node, IncludeNode):
             template_name = node.template_name
             if not template_name.endswith(".mg"):
@@ -109,23 +224,19 @@ class Renderer:
             try:
                 template_content = include_path.read_text()
 
-                parser = Parser()
-                _, included_nodes = parser.parse(template_content)
+                _, included_nodes = parse_cached(template_content)
 
                 # Create a new context with include parameters merged in
                 include_context = self.context.copy()
                 include_context.update(node.params)
 
                 included_renderer = Renderer(context=include_context, base_path=self.base_path)
-                return included_renderer.render(included_nodes)
+                output.append(included_renderer.render(included_nodes))
 
             except FileNotFoundError:
                 print(f"Included template not found: {include_path}")
-                return ""
             except Exception:
-                return ""
-        else:
-            return ""
+                pass
 
     def _get_variable_value(self, name: str) -> Any:
         """Get a variable value from context, supporting dotted notation.
@@ -136,21 +247,18 @@ class Renderer:
         Returns:
             The variable value or None if not found
         """
-        parts = name.split(".")
-        value = self.context
-
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            elif hasattr(value, part):
-                value = getattr(value, part)
-            else:
-                return None
+        return self._resolve_path(variable_path(name))
+
+    def _resolve_path(self, path: tuple[str, ...]) -> Any:
+        """Resolve a pre-split variable path against the context.
 
-            if value is None:
-                return None
+        Args:
+            path: Lookup path such as ("user", "name")
 
-        return value
+        Returns:
+            The variable value or None if not found
+        """
+        return resolve_path(self.context, path)
 
     @staticmethod
     def _is_truthy(value: Any) -> bool:
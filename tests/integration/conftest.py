@@ -0,0 +1,70 @@
+"""Shared fixtures for the integration tests."""
+
+import base64
+import mmap
+import os
+import pathlib
+import pickle
+
+import pytest
+
+import margarita.parser
+from margarita.parser import Parser
+
+FILES_DIR = (pathlib.Path(__file__).parent / "files").resolve()
+
+
+def _stamp(path: pathlib.Path) -> list[int]:
+    """Return the (mtime, size) pair identifying the current contents of a file."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _read_template(path: pathlib.Path) -> str:
+    """Decode a template straight from a memory map, without an intermediate bytes copy.
+
+    Newlines are normalised like text-mode reads, so CRLF checkouts parse the same.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            content = str(mapped, "utf-8")
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@pytest.fixture(scope="session")
+def files_dir():
+    """Get the files directory path."""
+    return FILES_DIR
+
+
+@pytest.fixture(scope="session")
+def parsed_templates(request, files_dir):
+    """Parse every .mg file once, keyed by file name.
+
+    Results are pickled into the pytest cache (``.pytest_cache``) and reused
+    across runs until the template or the parser module changes.
+    """
+    cache = getattr(request.config, "cache", None)
+    parser_stamp = _stamp(pathlib.Path(margarita.parser.__file__))
+    parser = Parser()
+
+    templates = {}
+    for template_file in files_dir.glob("*.mg"):
+        key = f"margarita/parsed/{template_file.name}"
+        stamp = [*_stamp(template_file), *parser_stamp]
+
+        entry = cache.get(key, None) if cache is not None else None
+        if entry is not None and entry["stamp"] == stamp:
+            templates[template_file.name] = pickle.loads(base64.b64decode(entry["data"]))
+            continue
+
+        parsed = parser.parse(_read_template(template_file))
+        templates[template_file.name] = parsed
+        if cache is not None:
+            data = base64.b64encode(pickle.dumps(parsed)).decode("ascii")
+            cache.set(key, {"stamp": stamp, "data": data})
+
+    return templates
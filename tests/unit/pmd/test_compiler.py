@@ -0,0 +1,184 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from margarita.compiler import compile_template, specialize_template
+from margarita.parser import Parser
+from margarita.renderer import Renderer
+
+
+class TestCompiler:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
+
+    def _compile(self, template: str):
+        _, nodes = self.parser.parse(template)
+        return compile_template(nodes), nodes
+
+    def test_compile_template_should_substitute_variables_when_template_has_placeholders(self):
+        render, _ = self._compile("<<Hello, ${name}! User: ${user.id}>>")
+
+        result = render({"name": "Alice", "user": {"id": 42}})
+
+        assert result == "Hello, Alice! User: 42\n"
+
+    def test_compile_template_should_render_empty_string_when_variable_is_missing(self):
+        render, _ = self._compile("<<Hello, ${name}!>>")
+
+        assert render({}) == "Hello, !\n"
+        assert render() == "Hello, !\n"
+
+    def test_compile_template_should_pick_branch_when_template_has_if_else(self):
+        render, _ = self._compile("""if logged_in:
+    <<Welcome back!>>
+else:
+    <<Please log in.>>""")
+
+        assert render({"logged_in": True}) == "Welcome back!\n"
+        assert render({"logged_in": []}) == "Please log in.\n"
+
+    def test_compile_template_should_iterate_when_template_has_nested_for_loops(self):
+        render, _ = self._compile("""for category in categories:
+    <<# ${category}>>
+    for item in items:
+        <<- ${item}>>""")
+
+        result = render({"categories": ["A", "B"], "items": [1, 2]})
+
+        assert result == "# A\n- 1\n- 2\n# B\n- 1\n- 2\n"
+
+    def test_compile_template_should_not_modify_context_when_loop_shadows_variable(self):
+        render, _ = self._compile("""for item in items:
+    <<${item}>>
+<<Outer: ${item}>>""")
+        context = {"items": ["a", "b"], "item": "outer"}
+
+        result = render(context)
+
+        assert result == "a\nb\nOuter: outer\n"
+        assert context == {"items": ["a", "b"], "item": "outer"}
+
+    def test_compile_template_should_escape_text_when_content_has_python_syntax(self):
+        template = '<<"""quotes""" \\n ${x} {braces} \'single\'>>'
+        render, nodes = self._compile(template)
+
+        assert render({"x": 1}) == Renderer(context={"x": 1}).render(nodes)
+
+    def test_compile_template_should_render_includes_when_template_has_include(self):
+        with TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            (base_path / "greeting.mg").write_text("<<Hello ${name} (${role})>>")
+            render, nodes = self._compile('[[ greeting role="admin" ]]')
+
+            result = render({"name": "Batman"}, base_path)
+
+            assert result == "Hello Batman (admin)\n"
+            assert result == Renderer(context={"name": "Batman"}, base_path=base_path).render(nodes)
+
+    def test_compile_template_should_match_renderer_when_template_is_complex(self):
+        template = """<<# Rules for ${audience}>>
+if rules:
+    for rule in rules:
+        if rule.active:
+            <<- ${rule.text}>>
+        else:
+            <<- (inactive)>>
+else:
+    <<No rules.>>"""
+        render, nodes = self._compile(template)
+        contexts = [
+            {
+                "audience": "devs",
+                "rules": [{"active": True, "text": "Be kind"}, {"active": False, "text": "x"}],
+            },
+            {"audience": "ops", "rules": []},
+            {},
+        ]
+
+        for context in contexts:
+            assert render(context) == Renderer(context=dict(context)).render(nodes)
+
+    def test_compile_template_should_interpret_when_nesting_exceeds_python_limits(self):
+        # Past 100 levels the generated source raises IndentationError
+        depth = 110
+        template = "\n".join(" " * (4 * level) + f"if flag{level}:" for level in range(depth))
+        render, nodes = self._compile(template + "\n" + " " * (4 * depth) + "<<Deep ${name}>>")
+        context = {f"flag{level}": True for level in range(depth)}
+        context["name"] = "Alice"
+
+        assert render(context) == "Deep Alice\n"
+        assert render(context) == Renderer(context=dict(context)).render(nodes)
+
+    def test_compile_template_should_render_nothing_when_template_is_empty(self):
+        render, _ = self._compile("")
+
+        assert render({"name": "Alice"}) == ""
+
+
+class TestSpecializeTemplate:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
+
+    def _specialize(self, template: str):
+        _, nodes = self.parser.parse(template)
+        return specialize_template(nodes), nodes
+
+    def test_specialize_template_should_render_any_context_when_keys_differ(self):
+        render, _ = self._specialize("<<${greeting}, ${name}!>>")
+
+        assert render({"greeting": "Hi", "name": "Alice"}) == "Hi, Alice!\n"
+        assert render({"name": "Bob", "greeting": "Hello"}) == "Hello, Bob!\n"
+        assert render({"name": "Carol", "extra": 1}) == ", Carol!\n"
+        assert render({}) == ", !\n"
+        assert render() == ", !\n"
+
+    def test_specialize_template_should_match_renderer_when_loop_shadows_context_key(self):
+        render, nodes = self._specialize("""for item in items:
+    <<${item.name}>>
+    for item in tags:
+        <<- ${item}>>
+    <<After: ${item.name}>>
+<<Outer: ${item}>>""")
+        context = {"item": "outer", "items": [{"name": "A"}, {"name": "B"}], "tags": ["x"]}
+
+        result = render(context)
+
+        assert result == Renderer(context=dict(context)).render(nodes)
+        assert result == "A\n- x\nAfter: A\nB\n- x\nAfter: B\nOuter: outer\n"
+        assert context["item"] == "outer"
+
+    def test_specialize_template_should_match_renderer_when_values_are_missing_or_none(self):
+        render, nodes = self._specialize("""if missing:
+    <<Shown>>
+else:
+    <<Fallback ${missing.name}>>
+for item in missing:
+    <<${item}>>""")
+
+        for context in ({"other": True}, {"missing": None}, {"missing": {"name": "x"}}):
+            assert render(context) == Renderer(context=dict(context)).render(nodes)
+        assert render({"other": True}) == "Fallback \n"
+
+    def test_specialize_template_should_pass_loop_variables_when_include_is_inside_loop(self):
+        with TemporaryDirectory() as temp_dir:
+            base_path = Path(temp_dir)
+            (base_path / "row.mg").write_text("<<${title}: ${item}>>")
+            render, nodes = self._specialize("""for item in items:
+    [[ row ]]""")
+            context = {"title": "Row", "items": [1, 2]}
+
+            result = render(context, base_path)
+
+            assert result == "Row: 1\nRow: 2\n"
+            assert result == Renderer(context=dict(context), base_path=base_path).render(nodes)
+
+    def test_specialize_template_should_interpret_when_nesting_exceeds_python_limits(self):
+        depth = 25
+        template = "\n".join(
+            " " * (4 * level) + f"for x{level} in items:" for level in range(depth)
+        )
+        render, nodes = self._specialize(template + "\n" + " " * (4 * depth) + "<<${x0}>>")
+
+        assert render({"items": ["a"]}) == "a\n"
+        assert render({"items": ["a"]}) == Renderer(context={"items": ["a"]}).render(nodes)
@@ -132,6 +132,17 @@ for item in items:
 
         assert result == "No variables here.\n"
 
+    def test_render_should_render_template_when_loops_are_deeply_nested(self):
+        depth = 25
+        template = "\n".join(
+            " " * (4 * level) + f"for x{level} in items:" for level in range(depth)
+        )
+        self._create_template("deep.mg", template + "\n" + " " * (4 * depth) + "<<*>>")
+
+        result = self.composer.render("deep.mg", {"items": [1]})
+
+        assert result == "*\n"
+
     def test_render_should_render_empty_string_when_variable_is_missing(self):
         self._create_template("missing.mg", "<<Hello, ${name}!>>")
 
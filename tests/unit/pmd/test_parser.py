@@ -1,15 +1,21 @@
+import dataclasses
+
+import pytest
+
 from margarita.parser import (
     ForNode,
     IfNode,
     IncludeNode,
     Parser,
     TextNode,
+    parse_cached,
 )
 
 
 class TestParser:
-    def setup_method(self):
-        self.parser = Parser()
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
 
     def test_parse_should_parse_text_when_template_is_plain_text(self):
         template = "<<Hello, world!>>"
@@ -156,12 +162,26 @@ else:
 <<Text after>>"""
         _, nodes = self.parser.parse(template)
 
-        # Comments should be completely removed
-        assert len(nodes) == 2
+        # Comments should be completely removed and the surrounding text merged
+        assert len(nodes) == 1
         assert isinstance(nodes[0], TextNode)
-        assert isinstance(nodes[1], TextNode)
-        combined_content = nodes[0].content + nodes[1].content
-        assert "comment" not in combined_content.lower()
+        assert nodes[0].content == "Text before\nText after\n"
+        assert "comment" not in nodes[0].content.lower()
+
+    def test_parse_should_merge_adjacent_text_nodes_when_blocks_are_consecutive(self):
+        template = """<<First>>
+<<Second>>
+for item in items:
+    <<- ${item}>>
+    <<Done>>
+<<Last>>"""
+        _, nodes = self.parser.parse(template)
+
+        assert len(nodes) == 3
+        assert nodes[0] == TextNode("First\nSecond\n")
+        assert isinstance(nodes[1], ForNode)
+        assert nodes[1].block == [TextNode("- ${item}\nDone\n")]
+        assert nodes[2] == TextNode("Last\n")
 
     def test_parse_should_ignore_comments_when_template_has_multiline_comments(self):
         template = """// This is a comment
@@ -289,6 +309,13 @@ email: user@example.com
         assert ":" in metadata["description"]
         assert metadata["email"] == "user@example.com"
 
+    def test_parse_should_skip_empty_values_when_metadata_key_has_no_value(self):
+        template = "---\n  indented:   padded value  \nempty:\nnext: value\r\n---\n<<Content>>"
+        metadata, nodes = self.parser.parse(template)
+
+        assert metadata == {"indented": "padded value", "next": "value"}
+        assert nodes[0].content == "Content\n"
+
     def test_parse_should_parse_all_includes_when_template_has_multiple_includes(self):
         template = """[[ header.mg ]]
 <<Content here>>
@@ -330,10 +357,43 @@ email: user@example.com
         assert nodes[0].iterator == "list_item"
         assert nodes[0].iterable == "my_list"
 
+    def test_parse_should_share_text_nodes_when_text_is_identical(self):
+        _, nodes1 = self.parser.parse("<<Shared text>>")
+        _, nodes2 = self.parser.parse("if flag:\n    <<Shared text>>")
+
+        assert nodes1[0] is nodes2[0].true_block[0]
+        assert nodes1[0] == TextNode("Shared text\n")
+
+    def test_parse_should_return_frozen_nodes_when_template_is_parsed(self):
+        _, nodes = self.parser.parse("<<Hello>>")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            nodes[0].content = "Changed"
+
+    def test_parse_cached_should_reuse_nodes_when_template_is_identical(self):
+        template = "---\nkey: value\n---\n<<Hello, ${name}!>>"
+
+        metadata1, nodes1 = parse_cached(template)
+        metadata2, nodes2 = parse_cached(template)
+
+        assert nodes1 is nodes2
+        assert metadata1 == metadata2 == {"key": "value"}
+        assert metadata1 is not metadata2
+        assert (metadata1, nodes1) == self.parser.parse(template)
+
+    def test_parse_cached_should_parse_separately_when_templates_differ(self):
+        _, nodes1 = parse_cached("<<Text1>>")
+        _, nodes2 = parse_cached("<<Text2>>")
+
+        assert nodes1 is not nodes2
+        assert nodes1[0].content == "Text1\n"
+        assert nodes2[0].content == "Text2\n"
+
 
 class TestParserEdgeCases:
-    def setup_method(self):
-        self.parser = Parser()
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
 
     def test_parse_should_parse_if_when_if_statement_is_unclosed(self):
         template = """if condition:
@@ -378,8 +438,9 @@ class TestParserEdgeCases:
 class TestNewSyntaxValidation:
     """Tests to validate the new Python-style syntax features."""
 
-    def setup_method(self):
-        self.parser = Parser()
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
 
     def test_parse_should_require_text_blocks_for_plain_text(self):
         """Plain text without << >> delimiters should not be parsed as text nodes."""
@@ -0,0 +1,55 @@
+from margarita.parser import Parser
+from margarita.renderer import Renderer
+
+
+class TestRenderer:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = Parser()
+
+    def test_render_iter_should_yield_chunk_per_iteration_when_template_has_loop(self):
+        _, nodes = self.parser.parse("""<<Items:>>
+for item in items:
+    <<- ${item}>>""")
+        renderer = Renderer(context={"items": ["a", "b"]})
+
+        chunks = list(renderer.render_iter(nodes))
+
+        assert chunks == ["Items:\n", "- a\n", "- b\n"]
+
+    def test_render_iter_should_match_render_when_loops_are_nested_in_if(self):
+        _, nodes = self.parser.parse("""if show:
+    for row in rows:
+        for cell in cells:
+            <<${row}${cell}>>
+<<End>>""")
+        context = {"show": True, "rows": [1, 2], "cells": ["a", "b"]}
+
+        chunks = list(Renderer(context=dict(context)).render_iter(nodes))
+
+        assert chunks == ["1a\n", "1b\n", "2a\n", "2b\n", "End\n"]
+        assert "".join(chunks) == Renderer(context=dict(context)).render(nodes)
+
+    def test_render_should_join_render_iter_when_template_is_rendered(self):
+        _, nodes = self.parser.parse("""if show:
+    <<Hello, ${user.name}!>>
+else:
+    <<Hidden>>""")
+        context = {"show": True, "user": {"name": "Alice"}}
+
+        result = Renderer(context=context).render(nodes)
+
+        assert result == "".join(Renderer(context=context).render_iter(nodes))
+        assert result == "Hello, Alice!\n"
+
+    def test_render_iter_should_restore_context_when_iteration_stops_early(self):
+        _, nodes = self.parser.parse("""for item in items:
+    <<${item}>>""")
+        context = {"items": ["a", "b", "c"], "item": "outer"}
+        renderer = Renderer(context=context)
+
+        chunks = renderer.render_iter(nodes)
+        assert next(chunks) == "a\n"
+        chunks.close()
+
+        assert context["item"] == "outer"